@@ -1,7 +1,10 @@
 from roob.common_handlers import CommonHandlers
 from roob.framework import Roob
+from roob.log_pipeline import JsonFormatter, LogPipeline
 from roob.middlewares import ErrorHandlerMiddleware
+from core.service.product_service import ProductService
 from pathlib import Path
+import logging
 
 
 cwd = Path(__file__).resolve().parent
@@ -12,6 +15,15 @@ app = Roob(
 
 app.add_exception_handler(handler=CommonHandlers.generic_exception_handler)
 
+# Services are built once and injected into handlers on each request
+app.register_service(ProductService)
+
+# Error and access logs are written in batches by a background thread
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(JsonFormatter())
+log_pipeline = LogPipeline(handlers=[log_handler])
+log_pipeline.install()
+
 exception_handler_middleware = ErrorHandlerMiddleware(
     app=app
 )
\ No newline at end of file
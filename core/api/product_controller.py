@@ -2,13 +2,17 @@ from core import app
 from core.data import inventory
 from webob import Request, Response
 from roob.constants import HttpStatus
-from core.service.product_service import ProductService
+from core.service.product_service import BulkOperationError, ProductService
+
+MAX_BATCH_BODY_SIZE = 16 * 1024 * 1024
+# Upper bound of a single NDJSON product line
+MAX_BATCH_LINE_SIZE = 64 * 1024
 
 
 @app.route('/api/products')
 class ProductCreatController:
-    def __init__(self):
-        self.service = ProductService()
+    def __init__(self, service: ProductService):
+        self.service = service
 
     def get(self, request: Request) -> Response:
         return Response(
@@ -25,10 +29,63 @@ class ProductCreatController:
         )
 
 
+@app.route('/api/products/batch', max_body_size=MAX_BATCH_BODY_SIZE)
+class ProductBatchController:
+    def __init__(self, service: ProductService):
+        self.service = service
+
+    def _get_bad_request_response(self, message: str, errors: list[dict] = None) -> Response:
+        body = {"message": message}
+        if errors:
+            body["errors"] = errors
+        return Response(
+            json_body=body,
+            status=HttpStatus.BAD_REQUEST
+        )
+
+    # Batch insert, accepts a JSON array or one product per line (NDJSON)
+    def post(self, request: Request) -> Response:
+        try:
+            if request.content_type == "application/x-ndjson":
+                items = list(request.iter_ndjson(MAX_BATCH_LINE_SIZE))
+            else:
+                items = request.json
+        except ValueError:
+            return self._get_bad_request_response("Request body is not valid JSON")
+        return self._apply(items, self.service.bulk_create_products)
+
+    # Batch upsert
+    def put(self, request: Request) -> Response:
+        try:
+            items = request.json
+        except ValueError:
+            return self._get_bad_request_response("Request body is not valid JSON")
+        return self._apply(items, self.service.bulk_upsert_products)
+
+    # Batch delete, body: {"ids": [1, 2, 3]}
+    def delete(self, request: Request) -> Response:
+        try:
+            payload = request.json
+        except ValueError:
+            return self._get_bad_request_response("Request body is not valid JSON")
+        ids = payload.get("ids") if isinstance(payload, dict) else None
+        return self._apply(ids, self.service.bulk_delete_products)
+
+    def _apply(self, items, operation: callable) -> Response:
+        if not isinstance(items, list):
+            return self._get_bad_request_response("Request body must contain a list")
+        try:
+            return Response(
+                json_body=operation(items)
+            )
+        except BulkOperationError as e:
+            return self._get_bad_request_response(str(e), e.errors)
+
+
 @app.route('/api/products/{id:d}')
 class ProductModifyController:
-    def __init__(self):
-        self.service = ProductService()
+    def __init__(self, service: ProductService):
+        self.service = service
 
     def _get_product_not_found_response(self, product_id: int) -> Response:
         return Response(
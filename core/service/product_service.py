@@ -1,5 +1,26 @@
+import threading
+
 from core.data import products, inventory
 
+# Every write to products goes through this lock so a batch lands atomically
+_write_lock = threading.Lock()
+
+
+class BulkOperationError(Exception):
+    def __init__(self, errors: list[dict]):
+        super().__init__(f"Batch rejected with {len(errors)} invalid item(s)")
+        self.errors = errors
+
+
+def _is_valid_id(product_id) -> bool:
+    # bool is an int subclass, True/False are not product ids
+    return isinstance(product_id, int) and not isinstance(product_id, bool)
+
+
+def _product_id(product):
+    # Single product POSTs store the body as is, it may lack an id
+    return product.get('id') if isinstance(product, dict) else None
+
 
 class ProductService:
     def get_all_products(self) -> list[dict]:
@@ -12,12 +33,85 @@ class ProductService:
         return None
 
     def create_new_product(self, product: dict) -> list[dict]:
-        products.append(product)
-        return products
+        with _write_lock:
+            products.append(product)
+            return products
 
     def delete_product_by_id(self, product_id: int) -> list[dict]:
-        product = self.get_product_by_id(product_id)
-        if not product:
-            raise Exception(f"No product found with product id {product_id}")
-        products.remove(product)
-        return products
\ No newline at end of file
+        with _write_lock:
+            product = self.get_product_by_id(product_id)
+            if not product:
+                raise Exception(f"No product found with product id {product_id}")
+            products.remove(product)
+            return products
+
+    def bulk_create_products(self, new_products: list[dict]) -> dict:
+        with _write_lock:
+            existing_ids = self._existing_ids()
+            self._validate_batch(new_products, existing_ids, allow_existing=False)
+            products.extend(new_products)
+            return {"created": len(new_products), "total": len(products)}
+
+    def bulk_upsert_products(self, new_products: list[dict]) -> dict:
+        with _write_lock:
+            positions = {
+                _product_id(product): index
+                for index, product in enumerate(products)
+                if _is_valid_id(_product_id(product))
+            }
+            self._validate_batch(new_products, positions, allow_existing=True)
+
+            created = 0
+            for product in new_products:
+                index = positions.get(product['id'])
+                if index is None:
+                    products.append(product)
+                    created += 1
+                else:
+                    products[index] = product
+            return {
+                "created": created,
+                "updated": len(new_products) - created,
+                "total": len(products)
+            }
+
+    def bulk_delete_products(self, product_ids: list[int]) -> dict:
+        with _write_lock:
+            existing_ids = self._existing_ids()
+            errors = []
+            for index, product_id in enumerate(product_ids):
+                if not _is_valid_id(product_id):
+                    errors.append({"index": index, "message": "Product id must be an integer"})
+                elif product_id not in existing_ids:
+                    errors.append({
+                        "index": index,
+                        "message": f"No product found with product id {product_id}"
+                    })
+            if errors:
+                raise BulkOperationError(errors)
+
+            to_delete = set(product_ids)
+            products[:] = [product for product in products if _product_id(product) not in to_delete]
+            return {"deleted": len(to_delete), "total": len(products)}
+
+    @staticmethod
+    def _existing_ids() -> set:
+        ids = (_product_id(product) for product in products)
+        return {product_id for product_id in ids if _is_valid_id(product_id)}
+
+    @staticmethod
+    def _validate_batch(new_products: list[dict], existing_ids, allow_existing: bool) -> None:
+        errors = []
+        seen = set()
+        for index, product in enumerate(new_products):
+            product_id = _product_id(product)
+            if not _is_valid_id(product_id):
+                errors.append({"index": index, "message": "Product must have an integer id"})
+                continue
+            if product_id in seen:
+                errors.append({"index": index, "message": f"Duplicate product id {product_id} in batch"})
+            elif not allow_existing and product_id in existing_ids:
+                errors.append({"index": index, "message": f"Product id {product_id} already exists"})
+            seen.add(product_id)
+        if errors:
+            raise BulkOperationError(errors)
@@ -1 +1,2 @@
-from roob.framework import Roob
\ No newline at end of file
+from roob.framework import Roob
+from roob.router import Router
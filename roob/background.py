@@ -0,0 +1,203 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+import weakref
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Executors drained at interpreter exit, held weakly so apps can be collected
+_executors = weakref.WeakSet()
+
+
+@atexit.register
+def _shutdown_executors() -> None:
+    # Bounded, a stuck task must not keep the worker process from exiting
+    for executor in list(_executors):
+        executor.shutdown(executor.shutdown_timeout)
+
+
+class BackgroundTasks:
+    """
+    Callables to run once the response has been sent to the client. Handlers
+    either declare a `BackgroundTasks` parameter (injected per request) or
+    attach an instance to the returned response as `response.background`.
+    """
+
+    def __init__(self):
+        self.tasks = []
+
+    def add_task(self, func: callable, *args, **kwargs) -> None:
+        self.tasks.append((func, args, kwargs))
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def __iter__(self):
+        return iter(self.tasks)
+
+
+class BackgroundExecutor:
+    """
+    Bounded thread pool running background tasks. Workers are started on the
+    first submit. When the queue is full the task runs on the calling thread,
+    which by then has already sent the response body. Tasks submitted after
+    shutdown are dropped and counted. At interpreter exit the queue is drained
+    for at most `shutdown_timeout` seconds.
+    """
+
+    def __init__(
+            self,
+            max_workers: int = 4,
+            max_queue: int = 1000,
+            shutdown_timeout: Optional[float] = 5.0
+        ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.max_workers = max_workers
+        self.shutdown_timeout = shutdown_timeout
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._workers = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+        self._metrics_lock = threading.Lock()
+        self.completed = 0
+        self.failed = 0
+        self.ran_inline = 0
+        self.dropped = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def metrics(self) -> dict:
+        return {
+            "queue_depth": self.queue_depth,
+            "workers": len(self._workers),
+            "completed": self.completed,
+            "failed": self.failed,
+            "ran_inline": self.ran_inline,
+            "dropped": self.dropped,
+        }
+
+    def submit(self, func: callable, *args, **kwargs) -> None:
+        self._start_workers()
+        # Checked and enqueued under the lock so no task lands behind the stop sentinels
+        with self._lock:
+            if self._shutdown:
+                queued = None
+            else:
+                try:
+                    self._queue.put_nowait((func, args, kwargs))
+                    queued = True
+                except queue.Full:
+                    queued = False
+
+        if queued is None:
+            with self._metrics_lock:
+                self.dropped += 1
+            logger.warning("Background task %r dropped, executor is shut down", func)
+        elif not queued:
+            with self._metrics_lock:
+                self.ran_inline += 1
+            self._run(func, args, kwargs)
+
+    def submit_all(self, tasks: Iterable) -> None:
+        for func, args, kwargs in tasks:
+            self.submit(func, *args, **kwargs)
+
+    def shutdown(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stop accepting tasks and drain the queue. Returns False when the
+        workers did not finish within the timeout.
+        """
+        with self._lock:
+            if self._shutdown:
+                return True
+            self._shutdown = True
+            workers = list(self._workers)
+
+        for _ in workers:
+            self._queue.put(None)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in workers:
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            worker.join(remaining)
+        if not any(worker.is_alive() for worker in workers):
+            return True
+
+        pending = self._pending_tasks()
+        logger.warning(
+            "Background executor did not drain within %ss, %d task(s) still pending: %s",
+            timeout, len(pending), ", ".join(repr(func) for func, _, _ in pending)
+        )
+        return False
+
+    def _pending_tasks(self) -> list:
+        with self._queue.mutex:
+            return [task for task in self._queue.queue if task is not None]
+
+    def _start_workers(self) -> None:
+        if self._workers:
+            return
+        with self._lock:
+            if self._workers or self._shutdown:
+                return
+            for index in range(self.max_workers):
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"roob-background-{index}",
+                    daemon=True
+                )
+                worker.start()
+                self._workers.append(worker)
+            _executors.add(self)
+
+    def _work(self) -> None:
+        while True:
+            task = self._queue.get()
+            try:
+                if task is None:
+                    return
+                self._run(*task)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, func: callable, args: tuple, kwargs: dict) -> None:
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            with self._metrics_lock:
+                self.failed += 1
+            logger.exception(e)
+        else:
+            with self._metrics_lock:
+                self.completed += 1
+
+
+class ClosingIterator:
+    """
+    Wraps a WSGI response iterable and hands the background tasks to the
+    executor once the server closes it, i.e. after the body has been sent.
+    """
+
+    def __init__(self, app_iter: Iterable, tasks: list, executor: BackgroundExecutor):
+        self.app_iter = app_iter
+        self.tasks = tasks
+        self.executor = executor
+
+    def __iter__(self):
+        return iter(self.app_iter)
+
+    def close(self):
+        try:
+            if hasattr(self.app_iter, "close"):
+                self.app_iter.close()
+        finally:
+            for tasks in self.tasks:
+                self.executor.submit_all(tasks)
@@ -1,38 +1,70 @@
+import json
 import logging
 from webob import Request, Response
-from http import HTTPStatus
+from roob.constants import HttpStatus
 
 logger = logging.getLogger(__name__)
 
 
+class ErrorTemplate:
+    """
+    JSON error body serialized once at import time. Each `{}` slot in the
+    message is filled per request by splicing in the JSON escaped value, so
+    serving an error costs a few byte joins instead of a json.dumps.
+    """
+    _SLOT = "\x00"
+
+    def __init__(self, status: str, message: str):
+        self.status = status
+        body = json.dumps({"message": message.replace("{}", self._SLOT)})
+        self.parts = [part.encode("utf-8") for part in body.split("\\u0000")]
+
+    def render(self, *values: str) -> Response:
+        chunks = [self.parts[0]]
+        for value, part in zip(values, self.parts[1:]):
+            chunks.append(json.dumps(value)[1:-1].encode("utf-8"))
+            chunks.append(part)
+        return Response(
+            body=b"".join(chunks),
+            status=self.status,
+            content_type="application/json",
+            charset=None
+        )
+
+
+_NOT_FOUND = ErrorTemplate(HttpStatus.NOT_FOUND, "Requested path: {} does not exist")
+_NOT_FOUND_QUIET = ErrorTemplate(HttpStatus.NOT_FOUND, "Requested path does not exist")
+_METHOD_NOT_ALLOWED = ErrorTemplate(HttpStatus.METHOD_NOT_ALLOWED, "{} request is not allowed for {}")
+_INTERNAL_SERVER_ERROR = ErrorTemplate(HttpStatus.INTERNAL_SERVER_ERROR, "Unhanded Exception Occurred: {}")
+_REQUEST_ENTITY_TOO_LARGE = ErrorTemplate(HttpStatus.REQUEST_ENTITY_TOO_LARGE, "Request body exceeds the limit of {} bytes")
+_SERVICE_UNAVAILABLE = ErrorTemplate(HttpStatus.SERVICE_UNAVAILABLE, "Server is overloaded, please retry later")
+
+
 class CommonHandlers:
     @staticmethod
     def generic_exception_handler(request: Request, excp: Exception) -> Response:
         logger.exception(excp)
-        response = {
-            "message": f"Unhanded Exception Occurred: {str(excp)}"
-        }
-        return Response(
-            json_body=response,
-            status=HTTPStatus.INTERNAL_SERVER_ERROR
-        )
+        return _INTERNAL_SERVER_ERROR.render(str(excp))
 
     @staticmethod
     def url_not_found_handler(request: Request) -> Response:
-        response = {
-            "message": f"Requested path: {request.path} does not exist"
-        }
-        return Response(
-            json_body=response,
-            status=HTTPStatus.NOT_FOUND
-        )
-    
+        return _NOT_FOUND.render(request.path)
+
+    @staticmethod
+    def url_not_found_quiet_handler(request: Request) -> Response:
+        # Same 404 without echoing the requested path back to the client
+        return _NOT_FOUND_QUIET.render()
+
     @staticmethod
     def method_not_allowed_handler(request: Request) -> Response:
-        response = {
-            "message": f"{request.method} request is not allowed for {request.path}"
-        }
-        return Response(
-            json_body=response,
-            status=HTTPStatus.METHOD_NOT_ALLOWED
-        )
\ No newline at end of file
+        return _METHOD_NOT_ALLOWED.render(request.method, request.path)
+
+    @staticmethod
+    def request_entity_too_large_handler(request: Request, max_body_size: int) -> Response:
+        return _REQUEST_ENTITY_TOO_LARGE.render(str(max_body_size))
+
+    @staticmethod
+    def service_unavailable_handler(request: Request, retry_after: int = 1) -> Response:
+        response = _SERVICE_UNAVAILABLE.render()
+        response.retry_after = retry_after
+        return response
@@ -0,0 +1,66 @@
+import threading
+import time
+
+
+class ConcurrencyLimiter:
+    """
+    Caps the number of requests running at once. When every slot is busy a
+    request may wait in a short bounded queue; once that queue is full (or the
+    wait times out) the request is rejected so the caller can fail fast.
+    """
+
+    def __init__(
+            self,
+            max_concurrency: int,
+            max_queue: int = 0,
+            queue_timeout: float = 1.0,
+            retry_after: int = 1
+        ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_queue < 0:
+            raise ValueError("max_queue can not be negative")
+
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+
+        self._condition = threading.Condition()
+        self._active = 0
+        self._waiting = 0
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    def acquire(self) -> bool:
+        with self._condition:
+            if self._active < self.max_concurrency:
+                self._active += 1
+                return True
+
+            if self._waiting >= self.max_queue:
+                return False
+
+            self._waiting += 1
+            try:
+                deadline = time.monotonic() + self.queue_timeout
+                while self._active >= self.max_concurrency:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+                self._active += 1
+                return True
+            finally:
+                self._waiting -= 1
+
+    def release(self) -> None:
+        with self._condition:
+            self._active -= 1
+            self._condition.notify()
@@ -1,5 +1,15 @@
 class HttpStatus:
     OK = "200 OK"
+    BAD_REQUEST = "400 Bad Request"
     INTERNAL_SERVER_ERROR = "500 Internal Server Error"
     NOT_FOUND = "404 Not Found"
-    METHOD_NOT_ALLOWED = "405 Method Not Allowed"
\ No newline at end of file
+    METHOD_NOT_ALLOWED = "405 Method Not Allowed"
+    REQUEST_ENTITY_TOO_LARGE = "413 Request Entity Too Large"
+    SERVICE_UNAVAILABLE = "503 Service Unavailable"
+
+
+# WSGI environ key holding the route template a request was matched against
+ROUTE_ENVIRON_KEY = "roob.route"
+
+# WSGI environ key holding the route match made by the body limit check, reused by dispatch
+ROUTE_MATCH_ENVIRON_KEY = "roob.route_match"
@@ -0,0 +1,140 @@
+import inspect
+import threading
+import typing
+from typing import Optional
+from webob import Request
+
+
+class Scope:
+    SINGLETON = "singleton"
+    THREAD = "thread"
+    REQUEST = "request"
+
+
+# WSGI environ key holding the request scoped service instances
+SERVICES_ENVIRON_KEY = "roob.services"
+
+# A service may only depend on services that live at least as long as it does
+_LIFETIMES = {Scope.REQUEST: 0, Scope.THREAD: 1, Scope.SINGLETON: 2}
+
+
+class ServiceProvider:
+    def __init__(self, service_type: type, factory: callable, scope: str, plan: tuple):
+        self.service_type = service_type
+        self.factory = factory
+        self.scope = scope
+        self.plan = plan
+        self.instance = None
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+
+class Container:
+    """
+    App scoped dependency injection container. Injection plans (parameter name
+    to service type) are computed once when a service or handler is registered,
+    so resolving dependencies on a request is only a handful of dict lookups.
+    """
+
+    def __init__(self):
+        self._providers = {}
+        self._plans = {}
+
+    def register(
+            self,
+            service_type: type,
+            factory: Optional[callable] = None,
+            scope: str = Scope.SINGLETON
+        ) -> None:
+        if scope not in (Scope.SINGLETON, Scope.THREAD, Scope.REQUEST):
+            raise ValueError(f"Unknown service scope: {scope}")
+        if service_type in self._providers:
+            raise RuntimeError(f"Service: {service_type.__name__} already registered")
+
+        factory = factory or service_type
+        self._providers[service_type] = ServiceProvider(
+            service_type=service_type,
+            factory=factory,
+            scope=scope,
+            plan=self._build_plan(factory)
+        )
+
+    def plan(self, target: callable) -> None:
+        """
+        Compute and cache the injection plan of a route handler, a class
+        handler is planned against its constructor.
+        """
+        if target not in self._plans:
+            self._plans[target] = self._build_plan(target)
+
+    def resolve(self, target: callable, request: Request) -> dict:
+        plan = self._plans.get(target)
+        if not plan:
+            return {}
+        return {
+            name: self.get(service_type, request)
+            for name, service_type in plan
+            if service_type in self._providers
+        }
+
+    def get(self, service_type: type, request: Optional[Request] = None):
+        provider = self._providers.get(service_type)
+        if provider is None:
+            raise LookupError(f"Service: {service_type.__name__} is not registered")
+
+        if provider.scope == Scope.SINGLETON:
+            if provider.instance is None:
+                with provider.lock:
+                    if provider.instance is None:
+                        provider.instance = self._create(provider, request)
+            return provider.instance
+
+        if provider.scope == Scope.THREAD:
+            instance = getattr(provider.local, "instance", None)
+            if instance is None:
+                instance = provider.local.instance = self._create(provider, request)
+            return instance
+
+        if request is None:
+            raise RuntimeError(
+                f"Service: {service_type.__name__} is request scoped and needs a request"
+            )
+        instances = request.environ.setdefault(SERVICES_ENVIRON_KEY, {})
+        if service_type not in instances:
+            instances[service_type] = self._create(provider, request)
+        return instances[service_type]
+
+    def _create(self, provider: ServiceProvider, request: Optional[Request]):
+        dependencies = {}
+        for name, service_type in provider.plan:
+            dependency = self._providers.get(service_type)
+            if dependency is None:
+                continue
+            # Checked on first build, services can be registered in any order
+            if _LIFETIMES[dependency.scope] < _LIFETIMES[provider.scope]:
+                raise RuntimeError(
+                    f"Service: {provider.service_type.__name__} is {provider.scope} scoped"
+                    f" and cannot depend on {dependency.scope} scoped {service_type.__name__}"
+                )
+            dependencies[name] = self.get(service_type, request)
+        return provider.factory(**dependencies)
+
+    @staticmethod
+    def _build_plan(target: callable) -> tuple:
+        init = target.__init__ if inspect.isclass(target) else target
+        try:
+            hints = typing.get_type_hints(init)
+        except Exception:
+            hints = {}
+
+        try:
+            parameters = inspect.signature(target).parameters.values()
+        except (TypeError, ValueError):
+            return ()
+
+        plan = []
+        for parameter in parameters:
+            annotation = hints.get(parameter.name, parameter.annotation)
+            if inspect.isclass(annotation) and annotation is not Request:
+                plan.append((parameter.name, annotation))
+        return tuple(plan)
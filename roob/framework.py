@@ -1,14 +1,40 @@
 from whitenoise import WhiteNoise
-from roob.routing_manager import RouteManager
+from roob.background import BackgroundExecutor, BackgroundTasks, ClosingIterator
+from roob.common_handlers import CommonHandlers
+from roob.concurrency import ConcurrencyLimiter
+from roob.dependency import Container, Scope, SERVICES_ENVIRON_KEY
+from roob.constants import ROUTE_ENVIRON_KEY
+from roob.request import JSON_DECODER_ENVIRON_KEY, RoobRequest
+from roob.router import Router
 from webob import Request, Response
 from jinja2 import Environment, FileSystemLoader
 
+import logging
 import os
+import time
 from typing import Optional
 
-class Roob:
-    def __init__(self, template_dir: str = "templates", static_dir: str = "static"):
-        self.routing_manager = RouteManager()
+access_logger = logging.getLogger("roob.access")
+
+
+class Roob(Router):
+    def __init__(
+            self,
+            template_dir: str = "templates",
+            static_dir: str = "static",
+            echo_not_found_path: bool = True
+        ):
+        self.container = Container()
+        self.container.register(BackgroundTasks, scope=Scope.REQUEST)
+        super().__init__(self.container)
+        if not echo_not_found_path:
+            self.routing_manager.not_found_handler = CommonHandlers.url_not_found_quiet_handler
+
+        # Decoder behind request.json, e.g. orjson.loads; None keeps json.loads
+        self.json_decoder: Optional[callable] = None
+
+        # Runs work handlers defer until after the response is sent
+        self.background_executor = BackgroundExecutor()
 
         # Initialize jinja2 env
         self.templates_env = Environment(
@@ -21,8 +47,6 @@ class Roob:
             root=static_dir
         )
 
-        self.exception_handler: Optional[callable] = None
-
     #Evoluton = 1.0 -----------------------------------
     '''
     def __call__(self, environ, start_response):
@@ -47,24 +71,62 @@ class Roob:
         return self.whitenoise(environ, start_response)
 
     def wsgi_app(self, environ, start_response):
-        http_request = Request(environ)
+        if self.json_decoder is not None:
+            environ[JSON_DECODER_ENVIRON_KEY] = self.json_decoder
+        http_request = RoobRequest(environ)
+        started = time.perf_counter()
         response = self._handle_request(http_request)
-        return response(environ, start_response)
+        if access_logger.isEnabledFor(logging.INFO):
+            self._log_access(http_request, response, started)
+        app_iter = response(environ, start_response)
+
+        tasks = self._get_background_tasks(http_request, response)
+        if tasks:
+            return ClosingIterator(app_iter, tasks, self.background_executor)
+        return app_iter
+
+    def set_concurrency_limit(
+            self,
+            max_concurrency: int,
+            max_queue: int = 0,
+            queue_timeout: float = 1.0,
+            retry_after: int = 1
+        ) -> ConcurrencyLimiter:
+        """
+        Global admission control applied to every route without its own limit.
+        Requests that find the wait queue full are rejected with a 503.
+        """
+        self.routing_manager.limiter = ConcurrencyLimiter(
+            max_concurrency=max_concurrency,
+            max_queue=max_queue,
+            queue_timeout=queue_timeout,
+            retry_after=retry_after
+        )
+        return self.routing_manager.limiter
 
-    def route(self, path: str):
-        def decorator(handler):
-            self.routing_manager.register(path, handler)
-            return handler
-        return decorator
-    
-    def add_route(self, path:str, handler:callable)-> None:
+    def set_json_decoder(self, decoder: callable) -> None:
         """
-        Django style explicit route registration.
-        :param path:
-        :param handler:
+        Replace the decoder used by request.json and request.iter_ndjson(),
+        it is called with the raw body bytes.
+        """
+        self.json_decoder = decoder
+
+    def register_service(
+            self,
+            service_type: type,
+            factory: Optional[callable] = None,
+            scope: str = Scope.SINGLETON
+        ) -> None:
+        """
+        Register a service for injection into handlers. Class-based handlers
+        receive it through their constructor, function handlers as a keyword
+        argument, matched by type annotation.
+        :param service_type: type handlers annotate their parameter with
+        :param factory: builds the instance, defaults to service_type itself
+        :param scope: Scope.SINGLETON, Scope.THREAD or Scope.REQUEST
         :return:
         """
-        self.routing_manager.register(path, handler)
+        self.container.register(service_type, factory, scope)
 
     def template(self, template_name:str, context: dict)->str:
         if context is None:
@@ -72,15 +134,32 @@ class Roob:
         
         return self.templates_env.get_template(template_name).render(**context)
 
-    def add_exception_handler(self, handler: callable) -> None:
-        self.exception_handler = handler
-    
-    def _handle_request(self, request: Request) -> Response:
-        # Handle Requests that are not made for any static file
-        try:
-            return self.routing_manager.dispatch(request)
-        except Exception as e:
-            if not self.exception_handler:
-                raise e
-            return self.exception_handler(request, e)
+    def shutdown(self, timeout: Optional[float] = None) -> bool:
+        """
+        Drain pending background tasks, call it from the server's worker exit hook.
+        """
+        return self.background_executor.shutdown(timeout)
+
+    @staticmethod
+    def _log_access(request: Request, response: Response, started: float) -> None:
+        access_logger.info(
+            "access",
+            extra={
+                "method": request.method,
+                "path": request.path,
+                "route": request.environ.get(ROUTE_ENVIRON_KEY),
+                "status": response.status_code,
+                "latency_ms": round((time.perf_counter() - started) * 1000, 3),
+            }
+        )
 
+    @staticmethod
+    def _get_background_tasks(request: Request, response: Response) -> list:
+        tasks = []
+        injected = request.environ.get(SERVICES_ENVIRON_KEY, {}).get(BackgroundTasks)
+        if injected:
+            tasks.append(injected)
+        attached = getattr(response, "background", None)
+        if attached and attached is not injected:
+            tasks.append(attached)
+        return tasks
@@ -1,8 +1,8 @@
 import inspect
 from webob import Request
 
-from parse import parse
 from roob.common_handlers import CommonHandlers
+from roob.dependency import Container
 
 
 def normalize_request_url(url):
@@ -12,29 +12,30 @@ def normalize_request_url(url):
 
 class RoutingHelper:
     @classmethod
-    def _find_handler(cls, routes: dict, request: Request) -> tuple:
-        requested_path = normalize_request_url(request.path)
-
+    def match_route(cls, routes: dict, requested_path: str, patterns: dict) -> tuple:
+        """
+        Find the route template for a normalized path without touching the
+        handler, returns (None, {}) when nothing matches.
+        """
         if requested_path in routes:
-            return routes[requested_path], {}
+            return requested_path, {}
 
-        # url that contains path variable
-        for path, handler in routes.items():
-            parsed = parse(path, requested_path)
+        # url that contains path variable, patterns are compiled at registration
+        for path in routes:
+            parsed = patterns[path].parse(requested_path)
             if parsed:
-                return handler, parsed.named
+                return path, parsed.named
+
+        return None, {}
 
-        # default fallback handler
-        return CommonHandlers.url_not_found_handler, {}
-    
     @classmethod
-    def _find_class_based_handler(cls, handler_class, request: Request, kwargs: dict) -> tuple:
+    def _find_class_based_handler(cls, handler_class, request: Request, kwargs: dict, dependencies: dict = None) -> tuple:
         """
         Handle class-based views by instantiating the class and finding the appropriate method
         based on the HTTP request method (GET, POST, DELETE, etc.)
         """
-        # Instantiate the handler class
-        handler_instance = handler_class()
+        # Instantiate the handler class, injecting its constructor dependencies
+        handler_instance = handler_class(**(dependencies or {}))
         
         # Get the HTTP method in lowercase (get, post, delete, etc.)
         method_name = request.method.lower()
@@ -48,8 +49,15 @@ class RoutingHelper:
         return CommonHandlers.method_not_allowed_handler, {}
     
     @classmethod
-    def get_handler(cls, routes: dict, request: Request) -> tuple:
-        handler, kwargs = cls._find_handler(routes, request)
+    def resolve_handler(cls, handler, request: Request, kwargs: dict, container: Container = None) -> tuple:
+        """
+        Turn a matched route handler into the callable to invoke, resolving its
+        dependencies and instantiating class-based handlers.
+        """
+        dependencies = container.resolve(handler, request) if container else {}
         if inspect.isclass(handler):
-            handler, kwargs = cls._find_class_based_handler(handler, request, kwargs)
+            return cls._find_class_based_handler(handler, request, kwargs, dependencies)
+
+        for name, dependency in dependencies.items():
+            kwargs.setdefault(name, dependency)
         return handler, kwargs
@@ -0,0 +1,208 @@
+import atexit
+import copy
+import json
+import logging
+import queue
+import threading
+import time
+from typing import Iterable, Optional
+
+# Attributes every LogRecord has, anything else was passed through `extra`
+_RECORD_ATTRS = set(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per record, `extra` fields (route, status, latency_ms ...)
+    are emitted as top level keys.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class DedupTracebackFilter(logging.Filter):
+    """
+    Keeps the traceback only for the first occurrence of an exception within
+    `interval` seconds. Repeats are still logged, without the costly traceback,
+    and the next full traceback reports how many were suppressed.
+    """
+
+    def __init__(self, interval: float = 60.0, max_keys: int = 1024):
+        super().__init__()
+        self.interval = interval
+        self.max_keys = max_keys
+        self._seen = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not record.exc_info or not record.exc_info[1]:
+            return True
+
+        key = self._get_key(record.exc_info)
+        now = time.monotonic()
+        with self._lock:
+            last_logged, suppressed = self._seen.get(key, (None, 0))
+            if last_logged is not None and now - last_logged < self.interval:
+                self._seen[key] = (last_logged, suppressed + 1)
+                record.exc_info = None
+                record.exc_text = None
+                return True
+
+            if len(self._seen) >= self.max_keys:
+                self._seen.clear()
+            self._seen[key] = (now, 0)
+
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+    @staticmethod
+    def _get_key(exc_info) -> tuple:
+        exc_type, exc, tb = exc_info
+        while tb is not None and tb.tb_next is not None:
+            tb = tb.tb_next
+        location = (tb.tb_frame.f_code.co_filename, tb.tb_lineno) if tb else None
+        return exc_type, str(exc), location
+
+
+class BoundedQueueHandler(logging.Handler):
+    """
+    Puts records on a bounded queue without blocking; records are dropped,
+    and counted, when the queue is full.
+    """
+
+    def __init__(self, log_queue: queue.Queue, dedup: Optional[DedupTracebackFilter] = None):
+        super().__init__()
+        self.queue = log_queue
+        self.dedup = dedup
+        self.dropped = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Work on a copy, other handlers of the logger still see the original record
+        record = copy.copy(record)
+        # Merge args on the request thread, the traceback is formatted by the writer
+        record.msg = record.getMessage()
+        record.args = None
+        if self.dedup is not None:
+            self.dedup.filter(record)
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogPipeline:
+    """
+    Moves log I/O off the request thread: loggers hand records to a bounded
+    queue and a background writer formats them and writes them in batches.
+    """
+
+    def __init__(
+            self,
+            handlers: Iterable[logging.Handler],
+            max_queue: int = 10000,
+            batch_size: int = 100,
+            flush_interval: float = 0.5,
+            dedup_interval: float = 60.0
+        ):
+        self.handlers = list(handlers)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.queue_handler = BoundedQueueHandler(self.queue, DedupTracebackFilter(dedup_interval))
+
+        self._writer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def dropped(self) -> int:
+        return self.queue_handler.dropped
+
+    def install(self, logger_names: Iterable[str] = ("roob",), level: int = logging.INFO) -> None:
+        """
+        Route the given loggers through the pipeline, "roob" covers both the
+        framework's error logs and the "roob.access" access log.
+        """
+        for name in logger_names:
+            logger = logging.getLogger(name)
+            logger.addHandler(self.queue_handler)
+            logger.setLevel(level)
+            logger.propagate = False
+        self.start()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(
+                target=self._write_loop,
+                name="roob-log-writer",
+                daemon=True
+            )
+            self._writer.start()
+            atexit.register(self.stop)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        self.queue.put(None)
+        writer.join(timeout)
+
+    def _write_loop(self) -> None:
+        while True:
+            try:
+                record = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            batch = []
+            while record is not None:
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    record = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            self._write_batch(batch)
+            if record is None:
+                return
+
+    def _write_batch(self, batch: list) -> None:
+        for handler in self.handlers:
+            records = [record for record in batch if record.levelno >= handler.level]
+            if not records:
+                continue
+            try:
+                # Subclasses such as rotating file handlers need emit() to run
+                if type(handler) is logging.StreamHandler:
+                    # handle() would run the handler's filters, the batched write must too
+                    text = "".join(
+                        handler.format(record) + handler.terminator
+                        for record in records
+                        if handler.filter(record)
+                    )
+                    with handler.lock:
+                        handler.stream.write(text)
+                        handler.flush()
+                else:
+                    for record in records:
+                        handler.handle(record)
+            except Exception:
+                handler.handleError(records[0])
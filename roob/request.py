@@ -0,0 +1,99 @@
+import json
+from typing import Iterator, Optional
+from webob import Request
+
+# WSGI environ key holding the app's JSON decoder
+JSON_DECODER_ENVIRON_KEY = "roob.json_decoder"
+
+NDJSON_CHUNK_SIZE = 64 * 1024
+
+
+class RequestBodyTooLarge(Exception):
+    def __init__(self, max_body_size: int):
+        super().__init__(f"Request body exceeds the limit of {max_body_size} bytes")
+        self.max_body_size = max_body_size
+
+
+class LimitedInput:
+    """
+    Wraps `wsgi.input` of a request without Content-Length (chunked upload) and
+    raises RequestBodyTooLarge as soon as more than `max_body_size` bytes are read.
+    """
+
+    def __init__(self, stream, max_body_size: int):
+        self.stream = stream
+        self.max_body_size = max_body_size
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        # never ask for more than one byte past the limit
+        allowed = self.max_body_size - self.bytes_read + 1
+        size = allowed if size is None or size < 0 else min(size, allowed)
+        return self._count(self.stream.read(size))
+
+    def readline(self, size: int = -1) -> bytes:
+        allowed = self.max_body_size - self.bytes_read + 1
+        size = allowed if size is None or size < 0 else min(size, allowed)
+        return self._count(self.stream.readline(size))
+
+    def _count(self, data: bytes) -> bytes:
+        self.bytes_read += len(data)
+        if self.bytes_read > self.max_body_size:
+            raise RequestBodyTooLarge(self.max_body_size)
+        return data
+
+
+class RoobRequest(Request):
+    """
+    webob Request whose JSON helpers go through the app's pluggable decoder
+    and which can stream newline delimited JSON bodies.
+    """
+
+    @property
+    def json_decoder(self) -> callable:
+        return self.environ.get(JSON_DECODER_ENVIRON_KEY, json.loads)
+
+    def _json_body__get(self):
+        return self.json_decoder(self.body)
+
+    # Setting and deleting keep webob's behaviour
+    json_body = property(_json_body__get, Request.json_body.fset, Request.json_body.fdel)
+    json = json_body
+
+    def iter_ndjson(self, max_line_size: Optional[int] = None) -> Iterator:
+        """
+        Decode an NDJSON body one line at a time, reading it in fixed size
+        chunks so memory stays bounded by the longest line, not the body.
+        Every line, complete or not, is checked against `max_line_size`.
+        """
+        decoder = self.json_decoder
+        stream = self.body_file
+        # Only the new chunk is scanned, a long line is joined once when it ends
+        parts = []
+        line_size = 0
+        while True:
+            chunk = stream.read(NDJSON_CHUNK_SIZE)
+            if not chunk:
+                break
+            start = 0
+            end = chunk.find(b"\n")
+            while end != -1:
+                line_size += end - start
+                if max_line_size is not None and line_size > max_line_size:
+                    raise RequestBodyTooLarge(max_line_size)
+                parts.append(chunk[start:end])
+                line = b"".join(parts)
+                parts, line_size = [], 0
+                if line.strip():
+                    yield decoder(line)
+                start = end + 1
+                end = chunk.find(b"\n", start)
+
+            line_size += len(chunk) - start
+            if max_line_size is not None and line_size > max_line_size:
+                raise RequestBodyTooLarge(max_line_size)
+            parts.append(chunk[start:])
+
+        line = b"".join(parts)
+        if line.strip():
+            yield decoder(line)
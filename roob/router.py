@@ -0,0 +1,162 @@
+from typing import Literal, Optional, Union
+from webob import Request, Response
+
+from roob.background import BackgroundTasks
+from roob.common_handlers import CommonHandlers
+from roob.concurrency import ConcurrencyLimiter
+from roob.dependency import Container, SERVICES_ENVIRON_KEY
+from roob.request import RequestBodyTooLarge
+from roob.routing_manager import RouteManager
+
+
+class Router:
+    """
+    A group of routes with its own route table, middlewares and exception
+    handler. Routers are mounted under a prefix with `app.mount('/api', router)`
+    and the prefix picks the router before any route is matched, so a lookup
+    only considers the routes of the matched router.
+    """
+
+    def __init__(self, container: Optional[Container] = None):
+        self.routing_manager = RouteManager(container)
+        self.exception_handler: Optional[callable] = None
+        self.middlewares = []
+        self.mounts = {}
+        self._chain = self._dispatch
+
+    def route(
+            self,
+            path: str,
+            limit: Union[ConcurrencyLimiter, Literal[False], None] = None,
+            max_body_size: Optional[int] = None
+        ):
+        def decorator(handler):
+            self.routing_manager.register(path, handler, limit, max_body_size)
+            return handler
+        return decorator
+
+    def add_route(
+            self,
+            path:str,
+            handler:callable,
+            limit: Union[ConcurrencyLimiter, Literal[False], None] = None,
+            max_body_size: Optional[int] = None
+        )-> None:
+        """
+        Django style explicit route registration.
+        :param path:
+        :param handler:
+        :param limit: route specific ConcurrencyLimiter, False to bypass the global limit
+        :param max_body_size: request body limit in bytes, larger bodies get a 413
+        :return:
+        """
+        self.routing_manager.register(path, handler, limit, max_body_size)
+
+    def set_max_body_size(self, max_body_size: Optional[int]) -> None:
+        """
+        Default request body limit for routes without their own, mounted
+        routers fall back to their parent's.
+        """
+        self.routing_manager.max_body_size = max_body_size
+
+    def add_exception_handler(self, handler: callable) -> None:
+        self.exception_handler = handler
+
+    def add_middleware(self, middleware: callable) -> None:
+        """
+        Request level middleware, called as `middleware(request, call_next)`
+        and expected to return a Response. The first one added runs outermost.
+        """
+        self.middlewares.append(middleware)
+        self._chain = self._build_chain()
+
+    def mount(self, prefix: str, router: "Router") -> None:
+        if not prefix.startswith("/") or prefix == "/" or prefix.endswith("/"):
+            raise ValueError(f"Mount prefix: {prefix} must start and must not end with '/'")
+        if prefix in self.mounts:
+            raise RuntimeError(f"Prefix: {prefix} already bind to another router")
+
+        manager = router.routing_manager
+        manager.parent = self.routing_manager
+        manager.not_found_handler = self.routing_manager.not_found_handler
+        # Services are registered on the app, plan the router's handlers against it
+        manager.container = self.routing_manager.container
+        for handler in manager.routes.values():
+            manager.container.plan(handler)
+        self._propagate_settings(router)
+
+        self.mounts[prefix] = router
+
+    def _propagate_settings(self, router: "Router") -> None:
+        # Routers mounted before this one was mounted inherit the same settings
+        for child in router.mounts.values():
+            child.routing_manager.not_found_handler = router.routing_manager.not_found_handler
+            child.routing_manager.container = router.routing_manager.container
+            for handler in child.routing_manager.routes.values():
+                child.routing_manager.container.plan(handler)
+            self._propagate_settings(child)
+
+    def _handle_request(self, request: Request) -> Response:
+        try:
+            # The top level router enforces body limits before any middleware runs
+            if self.routing_manager.parent is None and request.is_body_readable:
+                rejected = self._check_request_body(request)
+                if rejected is not None:
+                    return rejected
+            return self._chain(request)
+        except RequestBodyTooLarge as e:
+            # Raised when a middleware reads past the limit of a chunked body
+            return CommonHandlers.request_entity_too_large_handler(request, e.max_body_size)
+        except Exception as e:
+            if not self.exception_handler:
+                raise e
+            # A failed request must not fire the side effects it queued
+            request.environ.get(SERVICES_ENVIRON_KEY, {}).pop(BackgroundTasks, None)
+            return self.exception_handler(request, e)
+
+    def _dispatch(self, request: Request) -> Response:
+        if self.mounts:
+            mounted = self._find_mount(request)
+            if mounted:
+                return mounted._handle_request(request)
+        return self.routing_manager.dispatch(request)
+
+    def _find_mount(self, request: Request) -> Optional["Router"]:
+        path = request.path_info
+        prefix = self._match_mount(path)
+        if prefix is None:
+            return None
+        request.script_name += prefix
+        request.path_info = path[len(prefix):] or "/"
+        return self.mounts[prefix]
+
+    def _match_mount(self, path: str) -> Optional[str]:
+        # Longest prefix wins, checked segment by segment from the deepest one
+        end = len(path)
+        while end > 0:
+            prefix = path[:end]
+            if prefix in self.mounts:
+                return prefix
+            end = path.rfind("/", 0, end)
+        return None
+
+    def _check_request_body(self, request: Request) -> Optional[Response]:
+        # Resolve the target router without rewriting the request paths
+        router, path = self, request.path_info
+        prefix = router._match_mount(path) if router.mounts else None
+        while prefix is not None:
+            router, path = router.mounts[prefix], path[len(prefix):] or "/"
+            prefix = router._match_mount(path) if router.mounts else None
+        return router.routing_manager.check_request_body(request, path)
+
+    def _build_chain(self) -> callable:
+        chain = self._dispatch
+        for middleware in reversed(self.middlewares):
+            chain = self._wrap(middleware, chain)
+        return chain
+
+    @staticmethod
+    def _wrap(middleware: callable, call_next: callable) -> callable:
+        def handle(request: Request) -> Response:
+            return middleware(request, call_next)
+        return handle
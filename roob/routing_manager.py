@@ -1,19 +1,165 @@
-from webob import Request
-from roob.helpers import RoutingHelper
+import threading
+from collections import OrderedDict
+from typing import Literal, Optional, Union
+from parse import compile as compile_pattern
+from webob import Request, Response
+from roob.common_handlers import CommonHandlers
+from roob.concurrency import ConcurrencyLimiter
+from roob.constants import ROUTE_ENVIRON_KEY, ROUTE_MATCH_ENVIRON_KEY
+from roob.dependency import Container
+from roob.helpers import RoutingHelper, normalize_request_url
+from roob.request import LimitedInput, RequestBodyTooLarge
 
 
 class RouteManager:
-    def __init__(self):
+    # Upper bound of remembered unmatched paths, scanners must not grow it freely
+    NOT_FOUND_CACHE_SIZE = 1024
+
+    def __init__(self, container: Optional[Container] = None):
         self.routes = {}
+        self.patterns = {}
+        # Set when mounted, unset limits fall back to the parent's
+        self.parent: Optional["RouteManager"] = None
+        self.not_found_handler: callable = CommonHandlers.url_not_found_handler
+        self.not_found_paths = OrderedDict()
+        self._not_found_lock = threading.Lock()
+        self.container = container or Container()
+        # Route specific limiters, False marks a route that bypasses limiting
+        self.limiters = {}
+        self.limiter: Optional[ConcurrencyLimiter] = None
+        # Route specific request body limits in bytes
+        self.body_limits = {}
+        self.max_body_size: Optional[int] = None
 
-    def register(self, path, handler):
+    def register(
+            self,
+            path,
+            handler,
+            limit: Union[ConcurrencyLimiter, Literal[False], None] = None,
+            max_body_size: Optional[int] = None
+        ):
         if path in self.routes:
             raise RuntimeError(f"Path: {path} already bind to another handler")
+        if not (limit is None or limit is False or isinstance(limit, ConcurrencyLimiter)):
+            raise ValueError("limit must be a ConcurrencyLimiter, False to bypass or None")
         self.routes[path] = handler
+        self.patterns[path] = compile_pattern(path)
+        with self._not_found_lock:
+            self.not_found_paths.clear()
+        self.container.plan(handler)
+        if limit is not None:
+            self.limiters[path] = limit
+        if max_body_size is not None:
+            self.body_limits[path] = max_body_size
 
     def dispatch(self, http_request: Request):
-        handler, kwargs = RoutingHelper.get_handler(self.routes, http_request)
-        return handler(http_request, **kwargs)
+        requested_path = normalize_request_url(http_request.path_info)
+        if requested_path in self.not_found_paths:
+            return self.not_found_handler(http_request)
+
+        route, kwargs = self._match(http_request, requested_path)
+        if route is None:
+            return self.not_found_handler(http_request)
+        http_request.environ[ROUTE_ENVIRON_KEY] = http_request.script_name + route
+
+        # Rejections happen before the handler is built or any service resolved
+        rejected = self._enforce_body_limit(http_request, route)
+        if rejected is not None:
+            return rejected
+
+        limiter = self._get_limiter(route)
+        if not limiter:
+            return self._call_handler(route, http_request, kwargs)
+
+        if not limiter.acquire():
+            return CommonHandlers.service_unavailable_handler(
+                http_request, limiter.retry_after
+            )
+        try:
+            return self._call_handler(route, http_request, kwargs)
+        finally:
+            limiter.release()
+
+    def check_request_body(self, http_request: Request, path_info: str) -> Optional[Response]:
+        """
+        Body limit check for the route `path_info` resolves to, run by the
+        app before any middleware can read the body.
+        """
+        requested_path = normalize_request_url(path_info)
+        if requested_path in self.not_found_paths:
+            return None
+        route, kwargs = RoutingHelper.match_route(self.routes, requested_path, self.patterns)
+        if route is None:
+            self._remember_not_found(requested_path)
+            return None
+        http_request.environ[ROUTE_MATCH_ENVIRON_KEY] = (self, requested_path, route, kwargs)
+        return self._enforce_body_limit(http_request, route)
+
+    def _match(self, http_request: Request, requested_path: str) -> tuple:
+        # Reuse the body limit check's match unless a middleware rewrote the path
+        match = http_request.environ.pop(ROUTE_MATCH_ENVIRON_KEY, None)
+        if match is not None and match[0] is self and match[1] == requested_path:
+            return match[2], match[3]
+
+        route, kwargs = RoutingHelper.match_route(self.routes, requested_path, self.patterns)
+        if route is None:
+            self._remember_not_found(requested_path)
+        return route, kwargs
+
+    def _enforce_body_limit(self, http_request: Request, route: Optional[str]) -> Optional[Response]:
+        max_body_size = self._get_max_body_size(route)
+        if max_body_size is None or not http_request.is_body_readable:
+            return None
+
+        # Reject on the declared length before a single body byte is read
+        content_length = http_request.content_length
+        if content_length is not None:
+            if content_length > max_body_size:
+                return CommonHandlers.request_entity_too_large_handler(http_request, max_body_size)
+            return None
+
+        if not isinstance(http_request.environ["wsgi.input"], LimitedInput):
+            http_request.environ["wsgi.input"] = LimitedInput(
+                http_request.environ["wsgi.input"], max_body_size
+            )
+        return None
+
+    def _call_handler(self, route: str, http_request: Request, kwargs: dict):
+        handler, kwargs = RoutingHelper.resolve_handler(
+            self.routes[route], http_request, kwargs, self.container
+        )
+        try:
+            return handler(http_request, **kwargs)
+        except RequestBodyTooLarge as e:
+            return CommonHandlers.request_entity_too_large_handler(http_request, e.max_body_size)
+
+    def _remember_not_found(self, path: str) -> None:
+        # Request threads share the cache, eviction and insert must not interleave
+        with self._not_found_lock:
+            while len(self.not_found_paths) >= self.NOT_FOUND_CACHE_SIZE:
+                self.not_found_paths.popitem(last=False)
+            self.not_found_paths[path] = True
+
+    def _get_max_body_size(self, path: Optional[str]) -> Optional[int]:
+        if path is None:
+            return None
+        if path in self.body_limits:
+            return self.body_limits[path]
+        manager = self
+        while manager.max_body_size is None and manager.parent is not None:
+            manager = manager.parent
+        return manager.max_body_size
+
+    def _get_limiter(self, path: Optional[str]) -> Optional[ConcurrencyLimiter]:
+        # Unmatched paths are answered by the cheap not found handler
+        if path is None:
+            return None
+        if path in self.limiters:
+            return self.limiters[path]
+        manager = self
+        while manager.limiter is None and manager.parent is not None:
+            manager = manager.parent
+        return manager.limiter
     
     '''
     def _find_handler(self, requested_path) -> tuple:
@@ -0,0 +1,154 @@
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Optional
+from urllib.parse import unquote, urlencode, urljoin, urlsplit
+from webob.headers import ResponseHeaders
+
+DEFAULT_BASE_URL = "http://testserver"
+
+
+class TestResponse:
+    """
+    Minimal response captured from a WSGI call, mirrors the parts of the
+    requests API the tests use.
+    """
+    __test__ = False
+
+    def __init__(self, status: str, headers: list, content: bytes):
+        self.status = status
+        self.status_code = int(status.split(" ", 1)[0])
+        self.headers = ResponseHeaders(headers)
+        self.content = content
+
+    @property
+    def encoding(self) -> str:
+        for param in self.headers.get("Content-Type", "").split(";")[1:]:
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "charset":
+                return value.strip('"')
+        return "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class Client:
+    """
+    In-process test client, builds the WSGI environ itself and calls the app
+    directly without any HTTP client stack. It keeps no per request state, so
+    one client can be shared between threads for concurrent stress tests.
+    """
+    __test__ = False
+
+    def __init__(self, app: callable, base_url: str = DEFAULT_BASE_URL):
+        self.app = app
+        self.base_url = base_url
+
+    def get(self, url: str, **kwargs) -> TestResponse:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> TestResponse:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> TestResponse:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> TestResponse:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> TestResponse:
+        return self.request("DELETE", url, **kwargs)
+
+    def request(
+            self,
+            method: str,
+            url: str,
+            params: Optional[dict] = None,
+            data=None,
+            json=None,
+            headers: Optional[dict] = None
+        ) -> TestResponse:
+        environ = self._build_environ(method, url, params, data, json, headers or {})
+        captured = []
+
+        def start_response(status, response_headers, exc_info=None):
+            captured[:] = [status, response_headers]
+            return lambda chunk: chunks.append(chunk)
+
+        chunks = []
+        app_iter = self.app(environ, start_response)
+        try:
+            chunks.extend(app_iter)
+        finally:
+            # Closing is what triggers post-response work such as background tasks
+            if hasattr(app_iter, "close"):
+                app_iter.close()
+
+        status, response_headers = captured
+        return TestResponse(status, response_headers, b"".join(chunks))
+
+    def stress(self, method: str, url: str, count: int, workers: int = 8, **kwargs) -> list[TestResponse]:
+        """
+        Send `count` identical requests from `workers` threads at once.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.request, method, url, **kwargs)
+                for _ in range(count)
+            ]
+            return [future.result() for future in futures]
+
+    def _build_environ(self, method, url, params, data, json_body, headers: dict) -> dict:
+        parts = urlsplit(urljoin(self.base_url + "/", url))
+        query = parts.query
+        if params:
+            query = "&".join(filter(None, [query, urlencode(params, doseq=True)]))
+
+        body, content_type = self._encode_body(data, json_body)
+        default_port = "443" if parts.scheme == "https" else "80"
+        environ = {
+            "REQUEST_METHOD": method.upper(),
+            "SCRIPT_NAME": "",
+            "PATH_INFO": unquote(parts.path or "/").encode("utf-8").decode("latin-1"),
+            "QUERY_STRING": query,
+            "SERVER_NAME": parts.hostname or "testserver",
+            "SERVER_PORT": str(parts.port or default_port),
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "HTTP_HOST": parts.netloc,
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": parts.scheme or "http",
+            "wsgi.input": BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        if content_type:
+            environ["CONTENT_TYPE"] = content_type
+
+        for name, value in headers.items():
+            key = name.upper().replace("-", "_")
+            if key in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+                environ[key] = str(value)
+            else:
+                environ[f"HTTP_{key}"] = str(value)
+        return environ
+
+    @staticmethod
+    def _encode_body(data, json_body) -> tuple:
+        if json_body is not None:
+            return json.dumps(json_body).encode("utf-8"), "application/json"
+        if data is None:
+            return b"", None
+        if isinstance(data, dict):
+            return urlencode(data, doseq=True).encode("ascii"), "application/x-www-form-urlencoded"
+        if isinstance(data, str):
+            return data.encode("utf-8"), None
+        return bytes(data), None
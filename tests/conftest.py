@@ -2,24 +2,19 @@ import pytest
 
 from pathlib import Path
 from roob import Roob
-from requests import Session as RequestsSession
-from wsgiadapter import WSGIAdapter as RequestsWSGIAdapter
 
 from roob.middlewares import ErrorHandlerMiddleware
+from roob.testing import Client
 from tests.constants import BASE_URL
 from tests.utils.temp_file_builder import TempFileBuilder
 
 
 class TestFramework(Roob):
     def test_session(self, base_url=BASE_URL):
-        session = RequestsSession()
-        session.mount(
-            prefix=base_url,
-            adapter=RequestsWSGIAdapter(
-                app=ErrorHandlerMiddleware(app=self)
-            )
+        return Client(
+            app=ErrorHandlerMiddleware(app=self),
+            base_url=base_url
         )
-        return session
 
 
 @pytest.fixture
@@ -0,0 +1,145 @@
+import logging
+import threading
+
+from webob import Request
+from webob.response import Response
+
+from roob.background import BackgroundExecutor, BackgroundTasks, _shutdown_executors
+
+
+def test_injected_background_tasks_run_after_response(app):
+    done = threading.Event()
+    calls = []
+
+    def audit(product_id):
+        calls.append(product_id)
+        done.set()
+
+    @app.route("/products/{id:d}")
+    def create(req, id: int, tasks: BackgroundTasks):
+        tasks.add_task(audit, id)
+        assert calls == []
+        return Response(text="created")
+
+    response = Request.blank("/products/7").get_response(app)
+    assert response.text == "created"
+    assert done.wait(timeout=5)
+    assert calls == [7]
+    assert app.shutdown(timeout=5)
+
+
+def test_background_tasks_attached_to_response(app):
+    done = threading.Event()
+
+    @app.route("/notify")
+    class NotifyResource:
+        def post(self, req):
+            response = Response(text="ok")
+            response.background = BackgroundTasks()
+            response.background.add_task(done.set)
+            return response
+
+    response = Request.blank("/notify", method="POST").get_response(app)
+    assert response.text == "ok"
+    assert done.wait(timeout=5)
+    assert app.shutdown(timeout=5)
+
+
+def test_executor_drains_queue_on_shutdown():
+    executor = BackgroundExecutor(max_workers=1, max_queue=100)
+    release = threading.Event()
+    calls = []
+
+    executor.submit(release.wait)
+    for index in range(10):
+        executor.submit(calls.append, index)
+    assert executor.queue_depth > 0
+
+    release.set()
+    assert executor.shutdown(timeout=5)
+    assert calls == list(range(10))
+    assert executor.metrics()["completed"] == 11
+
+
+def test_executor_runs_task_inline_when_queue_is_full():
+    executor = BackgroundExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    started = threading.Event()
+    calls = []
+
+    executor.submit(lambda: started.set() or release.wait())
+    started.wait(timeout=5)
+    executor.submit(calls.append, "queued")
+    executor.submit(calls.append, "inline")
+
+    assert calls == ["inline"]
+    assert executor.ran_inline == 1
+    release.set()
+    assert executor.shutdown(timeout=5)
+
+
+def test_failing_task_is_counted():
+    executor = BackgroundExecutor(max_workers=1)
+
+    def fail():
+        raise RuntimeError("A test exception")
+
+    executor.submit(fail)
+    assert executor.shutdown(timeout=5)
+    assert executor.failed == 1
+
+
+def test_exit_drain_is_bounded_and_logs_pending_tasks():
+    executor = BackgroundExecutor(max_workers=1, shutdown_timeout=0.05)
+    release = threading.Event()
+    started = threading.Event()
+    messages = []
+    collector = logging.Handler()
+    collector.emit = lambda record: messages.append(record.getMessage())
+    logger = logging.getLogger("roob.background")
+    logger.addHandler(collector)
+
+    def pending_task():
+        pass
+
+    executor.submit(lambda: started.set() or release.wait())
+    started.wait(timeout=5)
+    executor.submit(pending_task)
+
+    try:
+        _shutdown_executors()
+    finally:
+        release.set()
+        logger.removeHandler(collector)
+
+    [message] = messages
+    assert "1 task(s) still pending" in message
+    assert "pending_task" in message
+
+
+def test_submit_after_shutdown_is_dropped():
+    executor = BackgroundExecutor(max_workers=1)
+    calls = []
+    executor.submit(calls.append, "before")
+    assert executor.shutdown(timeout=5)
+
+    executor.submit(calls.append, "after")
+    assert calls == ["before"]
+    assert executor.metrics()["dropped"] == 1
+
+
+def test_injected_tasks_skipped_when_handler_fails(app):
+    calls = []
+
+    @app.route("/fail")
+    def fail(req, tasks: BackgroundTasks):
+        tasks.add_task(calls.append, "notify")
+        raise RuntimeError("A test exception")
+
+    app.add_exception_handler(lambda request, excp: Response(text=str(excp), status=500))
+    response = Request.blank("/fail").get_response(app)
+
+    assert response.status_code == 500
+    assert response.text == "A test exception"
+    assert app.shutdown(timeout=5)
+    assert calls == []
@@ -0,0 +1,113 @@
+import threading
+import time
+
+import pytest
+
+from webob.response import Response
+
+from roob.concurrency import ConcurrencyLimiter
+from roob.dependency import Scope
+from tests.constants import BASE_URL
+
+
+def test_limiter_rejects_when_queue_is_full():
+    limiter = ConcurrencyLimiter(max_concurrency=1, max_queue=0)
+
+    assert limiter.acquire()
+    assert not limiter.acquire()
+
+    limiter.release()
+    assert limiter.acquire()
+
+
+def test_limiter_queued_request_gets_released_slot():
+    limiter = ConcurrencyLimiter(max_concurrency=1, max_queue=1, queue_timeout=5)
+    limiter.acquire()
+    results = []
+
+    waiter = threading.Thread(target=lambda: results.append(limiter.acquire()))
+    waiter.start()
+    deadline = time.monotonic() + 5
+    while limiter.waiting == 0 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert limiter.waiting == 1
+    limiter.release()
+    waiter.join()
+
+    assert results == [True]
+    assert limiter.active == 1
+
+
+def test_limiter_queue_timeout():
+    limiter = ConcurrencyLimiter(max_concurrency=1, max_queue=1, queue_timeout=0.01)
+    limiter.acquire()
+
+    assert not limiter.acquire()
+    assert limiter.waiting == 0
+
+
+def test_overloaded_route_returns_service_unavailable(app, client):
+    limiter = ConcurrencyLimiter(max_concurrency=1, retry_after=5)
+
+    @app.route("/report", limit=limiter)
+    def report(req):
+        return Response(text="report")
+
+    limiter.acquire()
+    response = client.get(f"{BASE_URL}/report")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "5"
+
+    limiter.release()
+    response = client.get(f"{BASE_URL}/report")
+    assert response.status_code == 200
+    assert limiter.active == 0
+
+
+def test_route_can_bypass_global_limit(app, client):
+    limiter = app.set_concurrency_limit(max_concurrency=1)
+
+    @app.route("/health", limit=False)
+    def health(req):
+        return Response(text="ok")
+
+    @app.route("/test")
+    def test_handler(req):
+        return Response(text="test")
+
+    limiter.acquire()
+    assert client.get(f"{BASE_URL}/health").status_code == 200
+    assert client.get(f"{BASE_URL}/test").status_code == 503
+
+
+def test_rejected_request_builds_no_handler_or_service(app, client):
+    class Session:
+        built = 0
+
+        def __init__(self):
+            Session.built += 1
+
+    app.register_service(Session, scope=Scope.REQUEST)
+    limiter = ConcurrencyLimiter(max_concurrency=1)
+
+    @app.route("/report", limit=limiter)
+    class ReportResource:
+        instances = 0
+
+        def __init__(self, session: Session):
+            ReportResource.instances += 1
+
+        def get(self, req):
+            return Response(text="report")
+
+    limiter.acquire()
+    assert client.get(f"{BASE_URL}/report").status_code == 503
+    assert Session.built == 0
+    assert ReportResource.instances == 0
+
+
+def test_invalid_route_limit_exception(app):
+    with pytest.raises(ValueError, match="limit must be a ConcurrencyLimiter"):
+        @app.route("/report", limit=True)
+        def report(req):
+            return Response(text="report")
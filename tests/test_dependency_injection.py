@@ -0,0 +1,106 @@
+import threading
+
+import pytest
+from webob import Request
+from webob.response import Response
+
+from roob.dependency import Container, Scope
+from tests.constants import BASE_URL
+
+
+class Counter:
+    created = 0
+
+    def __init__(self):
+        Counter.created += 1
+        self.value = Counter.created
+
+
+class Repository:
+    def __init__(self, counter: Counter):
+        self.counter = counter
+
+
+@pytest.fixture(autouse=True)
+def reset_counter():
+    Counter.created = 0
+
+
+def test_constructor_injection_in_class_based_handler(app, client):
+    app.register_service(Counter)
+
+    @app.route("/counter")
+    class CounterResource:
+        def __init__(self, counter: Counter):
+            self.counter = counter
+
+        def get(self, req):
+            return Response(text=str(self.counter.value))
+
+    assert client.get(f"{BASE_URL}/counter").text == "1"
+    assert client.get(f"{BASE_URL}/counter").text == "1"
+    assert Counter.created == 1
+
+
+def test_parameter_injection_with_path_variable(app, client):
+    app.register_service(Counter, scope=Scope.REQUEST)
+
+    @app.route("/hello/{name}")
+    def hello(req, name: str, counter: Counter):
+        return Response(text=f"Hello {name} {counter.value}")
+
+    assert client.get(f"{BASE_URL}/hello/Alice").text == "Hello Alice 1"
+    assert client.get(f"{BASE_URL}/hello/Bob").text == "Hello Bob 2"
+
+
+def test_request_scope_is_shared_within_a_request():
+    container = Container()
+    container.register(Counter, scope=Scope.REQUEST)
+    container.register(Repository, scope=Scope.REQUEST)
+    request = Request.blank("/")
+
+    repository = container.get(Repository, request)
+    assert repository.counter is container.get(Counter, request)
+    assert container.get(Counter, Request.blank("/")) is not repository.counter
+
+
+def test_thread_scope_creates_one_instance_per_thread():
+    container = Container()
+    container.register(Counter, scope=Scope.THREAD)
+    instances = []
+
+    thread = threading.Thread(target=lambda: instances.append(container.get(Counter)))
+    thread.start()
+    thread.join()
+
+    assert container.get(Counter) is container.get(Counter)
+    assert container.get(Counter) is not instances[0]
+
+
+def test_singleton_cannot_depend_on_request_scoped_service():
+    container = Container()
+    container.register(Repository)
+    container.register(Counter, scope=Scope.REQUEST)
+
+    with pytest.raises(RuntimeError, match="singleton scoped and cannot depend on request scoped Counter"):
+        container.get(Repository, Request.blank("/"))
+
+
+def test_thread_scoped_service_cannot_depend_on_request_scoped_service():
+    container = Container()
+    container.register(Counter, scope=Scope.REQUEST)
+    container.register(Repository, scope=Scope.THREAD)
+
+    with pytest.raises(RuntimeError):
+        container.get(Repository, Request.blank("/"))
+
+
+def test_duplicate_service_registration_exception():
+    container = Container()
+    container.register(Counter)
+
+    with pytest.raises(
+        RuntimeError,
+        match="Service: Counter already registered"
+    ):
+        container.register(Counter)
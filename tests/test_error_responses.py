@@ -0,0 +1,73 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from webob.response import Response
+
+from roob.common_handlers import ErrorTemplate
+from tests.constants import BASE_URL
+from tests.utils.test_framework import TestFrameworkBuilder
+
+
+def test_error_template_escapes_values():
+    template = ErrorTemplate("404 Not Found", "Requested path: {} does not exist")
+
+    response = template.render('/a"b\\c')
+    assert response.status_code == 404
+    assert response.json == {"message": 'Requested path: /a"b\\c does not exist'}
+
+
+def test_unmatched_path_is_cached(app, client):
+    @app.route("/hello/{name}")
+    def hello(req, name: str):
+        return Response(text=f"Hello {name}")
+
+    response = client.get(f"{BASE_URL}/unknown/")
+    assert response.status_code == 404
+    assert "/unknown" in app.routing_manager.not_found_paths
+
+    response = client.get(f"{BASE_URL}/unknown")
+    assert response.status_code == 404
+    assert response.json() == {"message": "Requested path: /unknown does not exist"}
+
+
+def test_route_registration_clears_not_found_cache(app, client):
+    assert client.get(f"{BASE_URL}/late").status_code == 404
+
+    @app.route("/late")
+    def late(req):
+        return Response(text="late")
+
+    response = client.get(f"{BASE_URL}/late")
+    assert response.status_code == 200
+    assert response.text == "late"
+
+
+def test_not_found_cache_is_bounded(app, client):
+    app.routing_manager.NOT_FOUND_CACHE_SIZE = 2
+
+    for path in ("/a", "/b", "/c"):
+        client.get(f"{BASE_URL}{path}")
+    assert list(app.routing_manager.not_found_paths) == ["/b", "/c"]
+
+
+def test_not_found_without_path_echo():
+    app = TestFrameworkBuilder().echo_not_found_path(False).build()
+    client = app.test_session()
+
+    response = client.get(f"{BASE_URL}/secret-scan-path")
+    assert response.status_code == 404
+    assert response.json() == {"message": "Requested path does not exist"}
+
+
+def test_not_found_cache_is_thread_safe(app, client):
+    app.routing_manager.NOT_FOUND_CACHE_SIZE = 4
+
+    @app.route("/hello/{name}")
+    def hello(req, name: str):
+        return Response(text=f"Hello {name}")
+
+    paths = [f"{BASE_URL}/scan/{index}" for index in range(400)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        responses = list(executor.map(client.get, paths))
+
+    assert all(response.status_code == 404 for response in responses)
+    assert len(app.routing_manager.not_found_paths) <= 4
@@ -0,0 +1,139 @@
+import io
+import json
+import logging
+import logging.handlers
+import queue
+
+import pytest
+from webob.response import Response
+
+from roob.log_pipeline import BoundedQueueHandler, DedupTracebackFilter, JsonFormatter, LogPipeline
+from tests.constants import BASE_URL
+
+
+@pytest.fixture
+def log_stream():
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JsonFormatter())
+    pipeline = LogPipeline(handlers=[handler], flush_interval=0.01)
+    pipeline.install(logger_names=("roob.access", "tests.pipeline"))
+    yield stream, pipeline
+
+    pipeline.stop()
+    for name in ("roob.access", "tests.pipeline"):
+        logger = logging.getLogger(name)
+        logger.removeHandler(pipeline.queue_handler)
+        logger.setLevel(logging.NOTSET)
+        logger.propagate = True
+
+
+def _read_records(stream: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_access_log_contains_route_template_and_latency(app, client, log_stream):
+    stream, pipeline = log_stream
+
+    @app.route("/hello/{name}")
+    def hello(req, name: str):
+        return Response(text=f"Hello {name}")
+
+    client.get(f"{BASE_URL}/hello/Alice")
+    pipeline.stop()
+
+    [record] = _read_records(stream)
+    assert record["logger"] == "roob.access"
+    assert record["path"] == "/hello/Alice"
+    assert record["route"] == "/hello/{name}"
+    assert record["status"] == 200
+    assert record["latency_ms"] >= 0
+
+
+def test_repeated_tracebacks_are_deduplicated(log_stream):
+    stream, pipeline = log_stream
+    logger = logging.getLogger("tests.pipeline")
+
+    for _ in range(3):
+        try:
+            raise RuntimeError("A test exception")
+        except RuntimeError as e:
+            logger.exception(e)
+    pipeline.stop()
+
+    records = _read_records(stream)
+    assert len(records) == 3
+    assert "Traceback" in records[0]["exc"]
+    assert all("exc" not in record for record in records[1:])
+
+
+def test_traceback_is_logged_again_after_interval():
+    dedup = DedupTracebackFilter(interval=0)
+    records = []
+    for _ in range(2):
+        try:
+            raise RuntimeError("A test exception")
+        except RuntimeError as e:
+            record = logging.LogRecord("test", logging.ERROR, "", 0, e, (), None)
+            record.exc_info = (type(e), e, e.__traceback__)
+            dedup.filter(record)
+            records.append(record)
+
+    assert all(record.exc_info for record in records)
+
+
+def test_full_queue_drops_records():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=1))
+    record = logging.LogRecord("test", logging.INFO, "", 0, "message", (), None)
+
+    handler.emit(record)
+    handler.emit(record)
+    assert handler.dropped == 1
+
+
+def test_other_handlers_keep_the_original_record(log_stream):
+    stream, pipeline = log_stream
+    logger = logging.getLogger("tests.pipeline")
+    records = []
+    collector = logging.Handler()
+    collector.emit = records.append
+    logger.addHandler(collector)
+
+    try:
+        for _ in range(2):
+            try:
+                raise RuntimeError("A test exception")
+            except RuntimeError as e:
+                logger.exception(e)
+    finally:
+        logger.removeHandler(collector)
+
+    assert len(records) == 2
+    assert all(record.exc_info for record in records)
+
+
+def test_stream_handler_filters_are_applied(log_stream):
+    stream, pipeline = log_stream
+    pipeline.handlers[0].addFilter(lambda record: "secret" not in record.getMessage())
+    logger = logging.getLogger("tests.pipeline")
+
+    logger.info("public message")
+    logger.info("secret message")
+    pipeline.stop()
+
+    assert [record["message"] for record in _read_records(stream)] == ["public message"]
+
+
+def test_rotating_file_handler_rolls_over(tmp_path):
+    log_file = tmp_path / "roob.log"
+    handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=200, backupCount=5)
+    pipeline = LogPipeline(handlers=[handler], flush_interval=0.01)
+    pipeline.start()
+
+    for index in range(30):
+        record = logging.LogRecord("test", logging.INFO, "", 0, f"message {index:03d}", (), None)
+        pipeline.queue_handler.handle(record)
+    pipeline.stop()
+    handler.close()
+
+    assert len(list(tmp_path.iterdir())) > 1
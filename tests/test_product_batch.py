@@ -0,0 +1,138 @@
+import threading
+
+import pytest
+
+from core.data import products
+from core.main import app as core_app
+from core.service import product_service
+from roob.testing import Client
+from tests.constants import BASE_URL
+
+BATCH_URL = f"{BASE_URL}/api/products/batch"
+
+
+@pytest.fixture
+def core_client():
+    snapshot = list(products)
+    yield Client(app=core_app, base_url=BASE_URL)
+    products[:] = snapshot
+
+
+def test_batch_create_returns_summary(core_client):
+    response = core_client.post(BATCH_URL, json=[
+        {"id": 10, "product_name": "Pixel", "brand": "Google"},
+        {"id": 11, "product_name": "Galaxy Tab", "brand": "Samsung"},
+    ])
+
+    assert response.status_code == 200
+    assert response.json() == {"created": 2, "total": 4}
+
+
+def test_batch_create_accepts_ndjson(core_client):
+    response = core_client.post(
+        BATCH_URL,
+        data=b'{"id": 10}\n{"id": 11}\n',
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+
+    assert response.json() == {"created": 2, "total": 4}
+
+
+def test_batch_create_rejects_oversized_ndjson_line(core_client):
+    response = core_client.post(
+        BATCH_URL,
+        data=b'{"id": 10, "name": "' + b"x" * (64 * 1024) + b'"}\n',
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+
+    assert response.status_code == 413
+    assert len(products) == 2
+
+
+def test_batch_create_rejects_whole_batch(core_client):
+    response = core_client.post(BATCH_URL, json=[
+        {"id": 1},
+        {"id": 10},
+        {"id": 10},
+        {"product_name": "No id"},
+        {"id": True},
+    ])
+
+    assert response.status_code == 400
+    assert response.json() == {
+        "message": "Batch rejected with 4 invalid item(s)",
+        "errors": [
+            {"index": 0, "message": "Product id 1 already exists"},
+            {"index": 2, "message": "Duplicate product id 10 in batch"},
+            {"index": 3, "message": "Product must have an integer id"},
+            {"index": 4, "message": "Product must have an integer id"},
+        ]
+    }
+    assert len(products) == 2
+
+
+def test_batch_upsert_returns_summary(core_client):
+    response = core_client.put(BATCH_URL, json=[
+        {"id": 1, "product_name": "S25 Edge", "brand": "Samsung"},
+        {"id": 12, "product_name": "Pixel", "brand": "Google"},
+    ])
+
+    assert response.json() == {"created": 1, "updated": 1, "total": 3}
+    assert products[0]["product_name"] == "S25 Edge"
+
+
+def test_batch_upsert_rejects_duplicate_ids(core_client):
+    response = core_client.put(BATCH_URL, json=[{"id": 1}, {"id": 1}])
+
+    assert response.status_code == 400
+    assert response.json()["errors"] == [
+        {"index": 1, "message": "Duplicate product id 1 in batch"}
+    ]
+
+
+def test_batch_delete_returns_summary(core_client):
+    response = core_client.delete(BATCH_URL, json={"ids": [1, 2]})
+
+    assert response.json() == {"deleted": 2, "total": 0}
+
+
+def test_single_delete_waits_for_batch_write(core_client):
+    done = threading.Event()
+
+    def delete():
+        core_client.delete(f"{BASE_URL}/api/products/1")
+        done.set()
+
+    with product_service._write_lock:
+        thread = threading.Thread(target=delete)
+        thread.start()
+        assert not done.wait(0.1)
+    thread.join(5)
+
+    assert done.is_set()
+    assert [product["id"] for product in products] == [2]
+
+
+def test_batch_delete_rejects_invalid_ids(core_client):
+    response = core_client.delete(BATCH_URL, json={"ids": [1, [2], 99]})
+
+    assert response.status_code == 400
+    assert response.json()["errors"] == [
+        {"index": 1, "message": "Product id must be an integer"},
+        {"index": 2, "message": "No product found with product id 99"},
+    ]
+    assert len(products) == 2
+
+
+def test_batch_ignores_stored_products_without_id(core_client):
+    core_client.post(f"{BASE_URL}/api/products", json={"product_name": "No id"})
+
+    response = core_client.post(BATCH_URL, json=[{"id": 10}])
+    assert response.json() == {"created": 1, "total": 4}
+
+
+def test_batch_rejects_malformed_json(core_client):
+    response = core_client.post(BATCH_URL, data=b"[{", headers={"Content-Type": "application/json"})
+
+    assert response.status_code == 400
+    assert response.json() == {"message": "Request body is not valid JSON"}
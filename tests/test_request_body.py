@@ -0,0 +1,170 @@
+import io
+import json
+
+import pytest
+from webob import Request
+from webob.response import Response
+
+from roob import Router
+from roob.helpers import RoutingHelper
+from roob.request import LimitedInput, RequestBodyTooLarge, RoobRequest
+from tests.constants import BASE_URL
+
+
+def test_oversized_body_is_rejected_by_content_length(app, client):
+    calls = []
+
+    @app.route("/upload", max_body_size=8)
+    def upload(req):
+        calls.append(req)
+        return Response(text="ok")
+
+    response = client.post(f"{BASE_URL}/upload", data=b"x" * 9)
+    assert response.status_code == 413
+    assert response.json() == {"message": "Request body exceeds the limit of 8 bytes"}
+    assert calls == []
+
+    assert client.post(f"{BASE_URL}/upload", data=b"x" * 8).status_code == 200
+
+
+def test_app_body_limit_applies_to_mounted_router(app, client):
+    router = Router()
+    router.add_route("/upload", lambda req: Response(text="ok"))
+    router.add_route("/large", lambda req: Response(text="ok"), max_body_size=64)
+    app.mount("/api", router)
+    app.set_max_body_size(8)
+
+    assert client.post(f"{BASE_URL}/api/upload", data=b"x" * 9).status_code == 413
+    assert client.post(f"{BASE_URL}/api/large", data=b"x" * 9).status_code == 200
+
+
+def test_limited_input_stops_chunked_body():
+    stream = LimitedInput(io.BytesIO(b"x" * 100), max_body_size=10)
+
+    assert stream.read(10) == b"x" * 10
+    with pytest.raises(RequestBodyTooLarge):
+        stream.read()
+
+
+def test_iter_ndjson_decodes_line_by_line():
+    body = b'{"id": 1}\n\n{"id": 2}\n{"id": 3}'
+    request = RoobRequest.blank("/", method="POST", body=body)
+
+    assert list(request.iter_ndjson()) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+def test_iter_ndjson_rejects_oversized_line():
+    request = RoobRequest.blank("/", method="POST", body=b'{"id": 1}\n' + b"x" * 100)
+
+    with pytest.raises(RequestBodyTooLarge):
+        list(request.iter_ndjson(max_line_size=10))
+
+
+def test_iter_ndjson_rejects_oversized_complete_line():
+    request = RoobRequest.blank("/", method="POST", body=b'{"id": 1}\n' + b"x" * 100 + b"\n")
+    records = request.iter_ndjson(max_line_size=10)
+
+    assert next(records) == {"id": 1}
+    with pytest.raises(RequestBodyTooLarge):
+        next(records)
+
+
+def test_iter_ndjson_joins_lines_across_chunks(monkeypatch):
+    monkeypatch.setattr("roob.request.NDJSON_CHUNK_SIZE", 4)
+    body = b'{"id": 1}\n{"name": "long product name"}\n{"id": 3}'
+    request = RoobRequest.blank("/", method="POST", body=body)
+
+    assert list(request.iter_ndjson(max_line_size=30)) == [
+        {"id": 1}, {"name": "long product name"}, {"id": 3}
+    ]
+
+
+def test_pluggable_json_decoder(app):
+    decoded = []
+
+    def decoder(data: bytes):
+        decoded.append(data)
+        return json.loads(data)
+
+    @app.route("/echo")
+    def echo(req):
+        return Response(json_body=req.json)
+
+    app.set_json_decoder(decoder)
+    response = Request.blank(
+        "/echo", method="POST", body=b'{"id": 1}', content_type="application/json"
+    ).get_response(app)
+
+    assert response.json == {"id": 1}
+    assert decoded == [b'{"id": 1}']
+
+
+def test_request_json_can_be_assigned():
+    request = RoobRequest.blank("/", method="POST")
+    request.json = {"id": 1}
+
+    assert request.body == b'{"id":1}'
+    assert request.json == {"id": 1}
+    del request.json_body
+    assert request.body == b""
+
+
+def test_body_limit_applies_before_middleware(app, client):
+    seen = []
+
+    def read_body(request, call_next):
+        seen.append(request.body)
+        return call_next(request)
+
+    router = Router()
+    router.add_route("/upload", lambda req: Response(text="ok"), max_body_size=8)
+    router.add_middleware(read_body)
+    app.add_middleware(read_body)
+    app.mount("/api", router)
+
+    response = client.post(f"{BASE_URL}/api/upload", data=b"x" * 9)
+    assert response.status_code == 413
+    assert seen == []
+
+    assert client.post(f"{BASE_URL}/api/upload", data=b"x" * 8).status_code == 200
+    assert seen == [b"x" * 8, b"x" * 8]
+
+
+def test_body_request_is_matched_once(app, client, monkeypatch):
+    calls = []
+    match_route = RoutingHelper.match_route
+
+    def counting_match_route(*args):
+        calls.append(args[1])
+        return match_route(*args)
+
+    monkeypatch.setattr(RoutingHelper, "match_route", counting_match_route)
+    router = Router()
+    router.add_route("/items/{id:d}", lambda req, id: Response(text=str(id)), max_body_size=8)
+    app.mount("/api", router)
+
+    response = client.post(f"{BASE_URL}/api/items/7", data=b"x")
+    assert response.text == "7"
+    assert calls == ["/items/7"]
+
+    assert client.post(f"{BASE_URL}/api/missing", data=b"x").status_code == 404
+    assert "/missing" in router.routing_manager.not_found_paths
+    assert calls == ["/items/7", "/missing"]
+
+
+def test_chunked_body_is_limited_before_middleware(app):
+    def read_body(request, call_next):
+        request.body
+        return call_next(request)
+
+    app.add_route("/upload", lambda req: Response(text="ok"), max_body_size=8)
+    app.add_middleware(read_body)
+
+    request = Request.blank("/upload", method="POST")
+    request.environ["wsgi.input"] = io.BytesIO(b"x" * 100)
+    request.environ["wsgi.input_terminated"] = True
+    request.environ.pop("CONTENT_LENGTH", None)
+
+    response = request.get_response(app)
+    assert response.status_code == 413
+    assert response.json == {"message": "Request body exceeds the limit of 8 bytes"}
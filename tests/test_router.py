@@ -0,0 +1,116 @@
+import pytest
+from webob.response import Response
+
+from roob import Router
+from tests.constants import BASE_URL
+from tests.utils.test_framework import TestFrameworkBuilder
+
+
+def test_mounted_router_routes(app, client):
+    router = Router()
+
+    @router.route("/products/{id:d}")
+    def product(req, id: int):
+        return Response(text=f"product {id}")
+
+    @router.route("/")
+    def index(req):
+        return Response(text="api index")
+
+    app.mount("/api", router)
+
+    assert client.get(f"{BASE_URL}/api/products/7").text == "product 7"
+    assert client.get(f"{BASE_URL}/api").text == "api index"
+    assert client.get(f"{BASE_URL}/api/").text == "api index"
+    assert client.get(f"{BASE_URL}/products/7").status_code == 404
+
+
+def test_not_found_inside_router_echoes_full_path(app, client):
+    app.mount("/api", Router())
+
+    response = client.get(f"{BASE_URL}/api/missing")
+    assert response.status_code == 404
+    assert response.json() == {"message": "Requested path: /api/missing does not exist"}
+
+
+def test_longest_prefix_wins(app, client):
+    api = Router()
+    admin = Router()
+    api.add_route("/admin/users", lambda req: Response(text="api"))
+    admin.add_route("/users", lambda req: Response(text="admin"))
+
+    app.mount("/api", api)
+    app.mount("/api/admin", admin)
+
+    assert client.get(f"{BASE_URL}/api/admin/users").text == "admin"
+
+
+def test_router_middleware_and_exception_handler(app, client):
+    router = Router()
+    calls = []
+
+    def tag(request, call_next):
+        calls.append(request.path)
+        response = call_next(request)
+        response.headers["X-Router"] = "api"
+        return response
+
+    @router.route("/fail")
+    def fail(req):
+        raise RuntimeError("A test exception")
+
+    @router.route("/ok")
+    def ok(req):
+        return Response(text="ok")
+
+    router.add_middleware(tag)
+    router.add_exception_handler(
+        lambda request, excp: Response(text=str(excp), status=418)
+    )
+    app.mount("/api", router)
+
+    response = client.get(f"{BASE_URL}/api/ok")
+    assert response.headers["X-Router"] == "api"
+
+    response = client.get(f"{BASE_URL}/api/fail")
+    assert response.status_code == 418
+    assert response.text == "A test exception"
+    assert calls == ["/api/ok", "/api/fail"]
+
+
+def test_mounted_router_uses_app_services(app, client):
+    class Greeter:
+        def greet(self, name):
+            return f"Hello {name}"
+
+    router = Router()
+
+    @router.route("/hello/{name}")
+    def hello(req, name: str, greeter: Greeter):
+        return Response(text=greeter.greet(name))
+
+    app.register_service(Greeter)
+    app.mount("/api", router)
+
+    assert client.get(f"{BASE_URL}/api/hello/Alice").text == "Hello Alice"
+
+
+def test_duplicate_mount_exception(app):
+    app.mount("/api", Router())
+
+    with pytest.raises(
+        RuntimeError,
+        match="Prefix: /api already bind to another router"
+    ):
+        app.mount("/api", Router())
+
+
+def test_nested_router_inherits_not_found_handler():
+    app = TestFrameworkBuilder().echo_not_found_path(False).build()
+    api = Router()
+    api.mount("/v1", Router())
+    app.mount("/api", api)
+
+    response = app.test_session().get(f"{BASE_URL}/api/v1/secret")
+    assert response.status_code == 404
+    assert response.json() == {"message": "Requested path does not exist"}
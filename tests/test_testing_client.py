@@ -0,0 +1,68 @@
+import threading
+
+from webob.response import Response
+
+from roob.background import BackgroundTasks
+from tests.constants import BASE_URL
+
+
+def test_client_sends_query_headers_and_json(app, client):
+    @app.route("/echo")
+    def echo(req):
+        return Response(json_body={
+            "method": req.method,
+            "query": dict(req.GET),
+            "token": req.headers.get("X-Token"),
+            "body": req.json,
+        })
+
+    response = client.post(
+        f"{BASE_URL}/echo?page=1",
+        params={"size": 10},
+        json={"id": 1},
+        headers={"X-Token": "secret"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "method": "POST",
+        "query": {"page": "1", "size": "10"},
+        "token": "secret",
+        "body": {"id": 1},
+    }
+
+
+def test_client_accepts_relative_urls(app, client):
+    @app.route("/hello/{name}")
+    def hello(req, name: str):
+        return Response(text=f"Hello {name}")
+
+    assert client.get("/hello/Alice").text == "Hello Alice"
+
+
+def test_client_closes_response_for_background_tasks(app, client):
+    done = threading.Event()
+
+    @app.route("/notify")
+    def notify(req, tasks: BackgroundTasks):
+        tasks.add_task(done.set)
+        return Response(text="ok")
+
+    assert client.get(f"{BASE_URL}/notify").text == "ok"
+    assert done.wait(timeout=5)
+    assert app.shutdown(timeout=5)
+
+
+def test_client_concurrent_stress(app, client):
+    lock = threading.Lock()
+    hits = []
+
+    @app.route("/count")
+    def count(req):
+        with lock:
+            hits.append(threading.get_ident())
+        return Response(text="ok")
+
+    responses = client.stress("GET", f"{BASE_URL}/count", count=200, workers=8)
+    assert len(hits) == 200
+    assert all(response.status_code == 200 for response in responses)
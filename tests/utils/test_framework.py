@@ -1,17 +1,11 @@
 from roob import Roob
 from tests.constants import BASE_URL
-from requests import Session as RequestsSession
-from wsgiadapter import WSGIAdapter as RequestsWSGIAdapter
+from roob.testing import Client
 
 
 class TestFramework(Roob):
     def test_session(self, base_url=BASE_URL):
-        session = RequestsSession()
-        session.mount(
-            prefix=base_url,
-            adapter=RequestsWSGIAdapter(app=self)
-        )
-        return session
+        return Client(app=self, base_url=base_url)
 
 
 class TestFrameworkBuilder:
@@ -26,5 +20,9 @@ class TestFrameworkBuilder:
         self.kwargs["static_dir"] = static_dir
         return self
 
+    def echo_not_found_path(self, echo_not_found_path: bool):
+        self.kwargs["echo_not_found_path"] = echo_not_found_path
+        return self
+
     def build(self):
         return TestFramework(**self.kwargs)
\ No newline at end of file